@@ -1,10 +1,52 @@
 """API for Uhome bound to Home Assistant OAuth."""
 
-from aiohttp import ClientSession
+import asyncio
+import logging
+import time
 
+from aiohttp import ClientError, ClientSession
+
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_entry_oauth2_flow
 from utec_py.auth import AbstractAuth
 
+from .const import DOMAIN, OAUTH2_AUTHORIZE, OAUTH2_TOKEN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Refresh the access token in the background once it is this close to expiry.
+TOKEN_REFRESH_MARGIN = 300
+
+# hass.data[DOMAIN] key holding the OAuth2 implementation per client id.
+OAUTH2_IMPLEMENTATIONS = "oauth2_implementations"
+
+
+@callback
+def async_get_oauth2_implementation(
+    hass: HomeAssistant, client_id: str, client_secret: str
+) -> config_entry_oauth2_flow.LocalOAuth2Implementation:
+    """Return the OAuth2 implementation for the client credentials.
+
+    One implementation is kept per client id and replaced when the secret
+    changes, so flows for the same credentials share a single instance.
+    """
+    implementations = hass.data.setdefault(DOMAIN, {}).setdefault(
+        OAUTH2_IMPLEMENTATIONS, {}
+    )
+    implementation = implementations.get(client_id)
+    if implementation is None or implementation.client_secret != client_secret:
+        implementation = implementations[client_id] = (
+            config_entry_oauth2_flow.LocalOAuth2Implementation(
+                hass,
+                DOMAIN,
+                client_id,
+                client_secret,
+                OAUTH2_AUTHORIZE,
+                OAUTH2_TOKEN,
+            )
+        )
+    return implementation
+
 
 class AsyncConfigEntryAuth(AbstractAuth):
     """Provide Uhome Oauth2 authentication tied to an OAuth2 based config entry."""
@@ -17,9 +59,39 @@ class AsyncConfigEntryAuth(AbstractAuth):
         """Initialize Oauth2 auth."""
         super().__init__(websession)
         self._oauth_session = oauth_session
+        self._refresh_task: asyncio.Task | None = None
 
     async def async_get_access_token(self) -> str:
         """Return a valid access token."""
-        if self._oauth_session.valid_token is None:
-            await self._oauth_session.async_ensure_token_valid()
-        return self._oauth_session.token["access_token"]
+        session = self._oauth_session
+        refresh_task = self._refresh_task
+        if not session.valid_token:
+            if refresh_task is not None and not refresh_task.done():
+                # Wait for the background refresh rather than sending the
+                # same refresh_token a second time.
+                await refresh_task
+            if not session.valid_token:
+                await session.async_ensure_token_valid()
+        elif (
+            refresh_task is None or refresh_task.done()
+        ) and session.token["expires_at"] - time.time() < TOKEN_REFRESH_MARGIN:
+            self._refresh_task = session.hass.async_create_background_task(
+                self._async_refresh_token(), "u_tec token refresh"
+            )
+        return session.token["access_token"]
+
+    async def _async_refresh_token(self) -> None:
+        """Refresh the access token ahead of expiry, off the request path."""
+        session = self._oauth_session
+        try:
+            new_token = await session.implementation.async_refresh_token(
+                session.token
+            )
+        except (ClientError, KeyError) as err:
+            # The request path falls back to a blocking refresh on expiry.
+            _LOGGER.warning("Background token refresh failed: %s", err)
+            return
+        session.hass.config_entries.async_update_entry(
+            session.config_entry,
+            data={**session.config_entry.data, "token": new_token},
+        )
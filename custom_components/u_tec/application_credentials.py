@@ -11,6 +11,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_entry_oauth2_flow
 import voluptuous as vol
 
+from .api import async_get_oauth2_implementation
 from .const import DOMAIN, OAUTH2_AUTHORIZE, OAUTH2_TOKEN, DEFAULT_API_SCOPE
 
 
@@ -72,14 +73,9 @@ class UhomeAuthImplementation(AuthImplementation):
         client_secret = flow.data.get("client_secret")
         self._api_scope = flow.data.get("api_scope", DEFAULT_API_SCOPE)
 
-        # Create the implementation
-        implementation = config_entry_oauth2_flow.LocalOAuth2Implementation(
-            self.hass,
-            DOMAIN,
-            client_id,
-            client_secret,
-            OAUTH2_AUTHORIZE,
-            OAUTH2_TOKEN,
+        # Get the shared implementation for these credentials
+        implementation = async_get_oauth2_implementation(
+            self.hass, client_id, client_secret
         )
 
         # Register the implementation
@@ -100,14 +96,9 @@ class UhomeAuthImplementation(AuthImplementation):
         client_secret = flow.data.get("client_secret")
         self._api_scope = flow.data.get("api_scope", DEFAULT_API_SCOPE)
 
-        # Create the implementation
-        implementation = config_entry_oauth2_flow.LocalOAuth2Implementation(
-            self.hass,
-            DOMAIN,
-            client_id,
-            client_secret,
-            OAUTH2_AUTHORIZE,
-            OAUTH2_TOKEN,
+        # Get the shared implementation for these credentials
+        implementation = async_get_oauth2_implementation(
+            self.hass, client_id, client_secret
         )
 
         # Register the implementation
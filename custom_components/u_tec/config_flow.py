@@ -1,25 +1,22 @@
 """Config flow for Uhome."""
 
 import logging
+import time
 
 import voluptuous as vol
 
-from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry, ConfigFlowResult, OptionsFlow
 from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET
-from homeassistant.core import _LOGGER, HomeAssistant, callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_entry_oauth2_flow
 import homeassistant.helpers.config_validation as cv
 from homeassistant.util import Mapping
 
-from .const import (
-    CONF_API_SCOPE,
-    DEFAULT_API_SCOPE,
-    DOMAIN,
-    OAUTH2_AUTHORIZE,
-    OAUTH2_TOKEN,
-)
+from .api import async_get_oauth2_implementation
+from .const import CONF_API_SCOPE, DEFAULT_API_SCOPE, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -29,6 +26,11 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_REAUTH_CONFIRM_SCHEMA = vol.Schema({})
+
+# Seconds a device discovery response is reused by the options flow.
+DISCOVERY_CACHE_TTL = 30
+
 
 class UhomeOAuth2FlowHandler(
     config_entry_oauth2_flow.AbstractOAuth2FlowHandler, domain=DOMAIN
@@ -70,7 +72,7 @@ class UhomeOAuth2FlowHandler(
             self._client_secret = user_input[CONF_CLIENT_SECRET]
             self._api_scope = user_input.get(CONF_API_SCOPE, DEFAULT_API_SCOPE)
 
-            self.logger.debug(
+            _LOGGER.debug(
                 "Retrieved client credentials, starting oauth authentication"
             )
 
@@ -82,13 +84,8 @@ class UhomeOAuth2FlowHandler(
             }
 
             # Create and register the implementation
-            self.flow_impl = config_entry_oauth2_flow.LocalOAuth2Implementation(
-                self.hass,
-                DOMAIN,
-                self._client_id,
-                self._client_secret,
-                OAUTH2_AUTHORIZE,
-                OAUTH2_TOKEN,
+            self.flow_impl = async_get_oauth2_implementation(
+                self.hass, self._client_id, self._client_secret
             )
 
             # Register the implementation
@@ -105,20 +102,15 @@ class UhomeOAuth2FlowHandler(
         self,
     ) -> config_entry_oauth2_flow.LocalOAuth2Implementation:
         """Get OAuth2 implementation."""
-        return config_entry_oauth2_flow.LocalOAuth2Implementation(
-            self.hass,
-            DOMAIN,
-            self._client_id,
-            self._client_secret,
-            OAUTH2_AUTHORIZE,
-            OAUTH2_TOKEN,
+        return async_get_oauth2_implementation(
+            self.hass, self._client_id, self._client_secret
         )
 
     async def async_oauth_create_entry(
         self, data: dict[str, vol.Any]
-    ) -> config_entries.FlowResult:
+    ) -> ConfigFlowResult:
         """Create the config entry after successful OAuth2 authentication."""
-        self.logger.debug(
+        _LOGGER.debug(
             "Creating OAuth2 config entry with client_id=%s",
             self._client_id,
         )
@@ -137,7 +129,7 @@ class UhomeOAuth2FlowHandler(
     @callback
     def async_get_options_flow(
         config_entry: ConfigEntry,
-    ) -> config_entries.OptionsFlow:
+    ) -> OptionsFlow:
         """Get the options flow for this handler."""
         return OptionsFlowHandler()
 
@@ -154,7 +146,7 @@ class UhomeOAuth2FlowHandler(
         if user_input is None:
             return self.async_show_form(
                 step_id="reauth_confirm",
-                data_schema=vol.Schema({}),
+                data_schema=STEP_REAUTH_CONFIRM_SCHEMA,
             )
 
         return await self.async_step_user()
@@ -190,6 +182,7 @@ class OptionsFlowHandler(OptionsFlow):
         """Initialize options flow."""
         self.api = None
         self.devices: dict[str, vol.Any] = {}
+        self.discovered_devices: dict[str, str] = {}
 
     async def async_step_init(
         self, user_input: dict[str, vol.Any] | None
@@ -215,12 +208,19 @@ class OptionsFlowHandler(OptionsFlow):
             DOMAIN in self.hass.data
             and self.config_entry.entry_id in self.hass.data[DOMAIN]
         ):
-            self.api = self.hass.data[DOMAIN][self.config_entry.entry_id]["api"]
+            entry_data = self.hass.data[DOMAIN][self.config_entry.entry_id]
+            self.api = entry_data["api"]
         else:
             return self.async_abort(reason="no_api_conf")
 
         try:
-            response = await self.api.discover_devices()
+            cached = entry_data.get("discover_cache")
+            if cached and time.monotonic() - cached[0] < DISCOVERY_CACHE_TTL:
+                response = cached[1]
+            else:
+                response = await self.api.discover_devices()
+                if isinstance(response, dict) and "payload" in response:
+                    entry_data["discover_cache"] = (time.monotonic(), response)
             if "payload" in response:
                 self.discovered_devices = {
                     device[
@@ -230,12 +230,12 @@ class OptionsFlowHandler(OptionsFlow):
                 }
         except (ValueError, TypeError):
             errors["base"] = "cannot_connect"
-            discovered_devices = {}
+            self.discovered_devices = {}
 
-        existing_devices = self.config_entry.options.get("selected_devices", [])
-        all_devices = {discovered_devices}
+        existing_devices = set(self.config_entry.options.get("selected_devices", ()))
+        all_devices = self.discovered_devices
         default_selected = [
-            device_id for device_id in existing_devices if device_id in all_devices
+            device_id for device_id in all_devices if device_id in existing_devices
         ]
 
         if user_input is not None:
@@ -260,6 +260,9 @@ class OptionsFlowHandler(OptionsFlow):
     ) -> ConfigFlowResult:
         """Trigger reauthentication process."""
         if user_input is not None:
+            entry_data = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+            if entry_data:
+                entry_data.pop("discover_cache", None)
             return self.async_create_entry(title="", data={})
 
         return self.async_show_form(step_id="user")
@@ -16,6 +16,13 @@ from utec_py.exceptions import ApiError, AuthenticationError, DeviceError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device class per handle type keyword, checked in order against handleType.
+_DEVICE_TYPES: tuple[tuple[str, type[BaseDevice]], ...] = (
+    ("lock", Lock),
+    ("light", Light),
+    ("switch", Switch),
+)
+
 
 class UhomeDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Uhome data."""
@@ -43,10 +50,11 @@ class UhomeDataUpdateCoordinator(DataUpdateCoordinator):
             # Discover devices
             _LOGGER.debug("Discovering Uhome devices")
             discovery_data = await self.api.discover_devices()
-            if not discovery_data or "payload" not in discovery_data:
+            payload = discovery_data.get("payload") if discovery_data else None
+            if payload is None:
                 _LOGGER.error("Invalid discovery data received: %s", discovery_data)
                 return {}
-            devices_data = discovery_data.get("payload", {}).get("devices", [])
+            devices_data = payload.get("devices", [])
             _LOGGER.debug("Found %s devices in discovery data", len(devices_data))
 
             # Update existing devices and add new ones
@@ -58,15 +66,14 @@ class UhomeDataUpdateCoordinator(DataUpdateCoordinator):
 
                 if device_id not in self.devices:
                     # Create new device instance based on handle type
-                    if "lock" in handle_type.lower():
-                        _LOGGER.info("Adding new lock device: %s", device_id)
-                        device = Lock(device_data, self.api)
-                    elif "light" in handle_type.lower():
-                        _LOGGER.info("Adding new light device: %s", device_id)
-                        device = Light(device_data, self.api)
-                    elif "switch" in handle_type.lower():
-                        _LOGGER.info("Adding new switch device: %s", device_id)
-                        device = Switch(device_data, self.api)
+                    handle_type_lower = handle_type.lower()
+                    for keyword, device_cls in _DEVICE_TYPES:
+                        if keyword in handle_type_lower:
+                            _LOGGER.info(
+                                "Adding new %s device: %s", keyword, device_id
+                            )
+                            device = device_cls(device_data, self.api)
+                            break
                     else:
                         _LOGGER.debug(
                             "Skipping device %s with unsupported handle type: %s",